@@ -10,11 +10,19 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
 import yfinance as yf
-from datetime import datetime, timedelta
+from datetime import datetime, date
 import plotly.graph_objects as go
 import plotly.express as px
 from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
+import os
+import random
+import threading
 import time
 import json
 
@@ -98,115 +106,491 @@ st.markdown("""
 # API DATA FETCHERS
 # ============================================================================
 
+# Optional on-disk cache, layered behind st.cache_data: st.cache_data is the
+# in-process L1, joblib the L2 that survives restarts, so redeploys and
+# container restarts don't re-hit Yahoo's rate limiter for warm symbols.
+try:
+    from joblib import Memory
+    _memory = Memory('.cache', verbose=0)
+except ImportError:
+    _memory = None
+
+# Numba is optional: when installed the scalar numeric kernels get JIT
+# compiled; without it the plain-Python definitions run unchanged.
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if len(args) == 1 and not kwargs and callable(args[0]):
+            return args[0]
+
+        def decorate(func):
+            return func
+        return decorate
+
+# orjson parses the larger batch API payloads several times faster than the
+# stdlib; stdlib json handles bytes too, so the fallback is a drop-in.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# aiohttp is optional: with it the bulk-quote batches go out concurrently on
+# one event loop instead of sequentially over the pooled Session.
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+def _make_http_session() -> requests.Session:
+    """Build a Session with keep-alive pooling and retry/backoff.
+
+    Reusing pooled connections avoids a fresh TLS handshake (~50-200ms)
+    per request, and the Retry policy absorbs transient Yahoo 429/5xx
+    responses instead of dropping the symbol.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(['GET'])
+    )
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# One shared session for everything: the module-level fundamentals fetch,
+# yfinance tickers and the bulk quote calls all reuse the same pool.
+_http_session = _make_http_session()
+
+class _RateLimiter:
+    """Paced request starts shared across fetch threads.
+
+    Enforces a minimum interval between request starts so the pool holds a
+    steady, sustainable rate instead of bursting, tripping Yahoo's 429
+    limiter, and oscillating between full speed and failures.
+    """
+
+    def __init__(self, max_per_minute: int):
+        self._interval = 60.0 / max_per_minute
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self._interval
+        delay = start - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+# ~5 fetch starts/second across all workers; roughly the average spacing the
+# old per-worker jitter produced, but without the bursts.
+_fetch_pacer = _RateLimiter(max_per_minute=300)
+
+
+def _is_rate_limited(exc: Exception) -> bool:
+    """Best-effort detection of Yahoo's throttling responses."""
+    message = str(exc)
+    return '429' in message or 'Too Many Requests' in message
+
+
+_SYMBOLS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sp500_symbols.json')
+
+
+def _chunks(seq: List, size: int) -> List[List]:
+    """Split ``seq`` into consecutive chunks of at most ``size`` items."""
+    return [seq[i:i + size] for i in range(0, len(seq), size)]
+
+
+def _load_bundled_symbols() -> List[str]:
+    """Bundled S&P snapshot used when the Wikipedia scrape is unavailable."""
+    try:
+        with open(_SYMBOLS_FILE) as fh:
+            return json.load(fh)
+    except Exception:
+        return ['MSFT', 'AAPL', 'JNJ', 'V', 'PG', 'KO', 'WMT', 'JPM', 'BAC', 'DIS']
+
+
+def _fetch_symbol_fundamentals(symbol: str, cache_day: str) -> Optional[Dict]:
+    """Raw per-symbol yfinance fetch.
+
+    ``cache_day`` is only there to key the on-disk cache, so persisted
+    entries invalidate daily.
+    """
+    try:
+        ticker = yf.Ticker(symbol, session=_http_session)
+        info = ticker.info
+
+        # Each financial statement is an extra slow HTTP roundtrip, so fetch
+        # them lazily and only when info didn't already supply the derived
+        # field. The common case needs income_stmt/balance_sheet but can skip
+        # the cashflow statement entirely.
+        statements = {}
+
+        def stmt(name):
+            if name not in statements:
+                statements[name] = getattr(ticker, name)
+            return statements[name]
+
+        # Extract key metrics with error handling
+        data = {
+            'symbol': symbol,
+            'name': info.get('longName', symbol),
+            'price': info.get('currentPrice', info.get('regularMarketPrice', 0)),
+            'market_cap': info.get('marketCap', 0),
+            'sector': info.get('sector', 'Unknown'),
+            'industry': info.get('industry', 'Unknown'),
+
+            # Valuation metrics
+            'pe_ratio': info.get('trailingPE', info.get('forwardPE', 0)),
+            'pb_ratio': info.get('priceToBook', 0),
+            'ps_ratio': info.get('priceToSalesTrailing12Months', 0),
+            'peg_ratio': info.get('pegRatio', 0),
+
+            # Profitability metrics - kept as raw fractions (or None when
+            # missing); the screening frame scales them to percent columnwise
+            'roe': info.get('returnOnEquity'),
+            'roa': info.get('returnOnAssets'),
+            'profit_margin': info.get('profitMargins'),
+            'operating_margin': info.get('operatingMargins'),
+            'gross_margin': info.get('grossMargins'),
+
+            # Financial health
+            'current_ratio': info.get('currentRatio', 0),
+            'quick_ratio': info.get('quickRatio', 0),
+            'debt_to_equity': info.get('debtToEquity', 0),
+            'interest_coverage': StockDataFetcher._calculate_interest_coverage(stmt('income_stmt')),
+
+            # Growth metrics (raw fractions, see above)
+            'revenue_growth': info.get('revenueGrowth'),
+            'earnings_growth': info.get('earningsGrowth'),
+            'earnings_quarterly_growth': info.get('earningsQuarterlyGrowth'),
+
+            # Dividend metrics
+            'dividend_yield': info.get('dividendYield'),
+            'payout_ratio': info.get('payoutRatio'),
+            'dividend_rate': info.get('dividendRate', 0),
+            'five_year_avg_dividend_yield': info.get('fiveYearAvgDividendYield', 0),
+
+            # Management metrics (raw fractions, see above)
+            'insider_ownership': info.get('heldPercentInsiders'),
+            'institutional_ownership': info.get('heldPercentInstitutions'),
+
+            # Additional data
+            'beta': info.get('beta', 1.0),
+            'fifty_two_week_high': info.get('fiftyTwoWeekHigh', 0),
+            'fifty_two_week_low': info.get('fiftyTwoWeekLow', 0),
+            'avg_volume': info.get('averageVolume', 0),
+
+            # ESG scores (None when unavailable; coalesced to 50 columnwise)
+            'esg_score': (info.get('esgScores') or {}).get('totalEsg'),
+            'governance_score': (info.get('esgScores') or {}).get('governanceScore'),
+        }
+
+        # Calculate additional metrics
+        data['roic'] = StockDataFetcher._calculate_roic(
+            data, stmt('balance_sheet'), stmt('income_stmt'))
+
+        # Free cash flow usually comes straight from info (Yahoo's levered
+        # FCF); only fall back to the cashflow statement when it's missing.
+        fcf = info.get('freeCashflow')
+        if fcf:
+            data['free_cash_flow'] = float(fcf)
+        else:
+            data['free_cash_flow'] = StockDataFetcher._get_free_cash_flow(stmt('cashflow'))
+
+        return data
+
+    except Exception as e:
+        if _is_rate_limited(e):
+            raise  # let the batch fetcher back off and retry
+        st.warning(f"Error fetching data for {symbol}: {e}")
+        return None
+
+
+def _fetch_history(symbol: str, period: str, cache_day: str) -> pd.DataFrame:
+    """Raw per-symbol history download.
+
+    ``cache_day`` is only there to key the on-disk cache, so persisted
+    entries invalidate daily.
+    """
+    try:
+        ticker = yf.Ticker(symbol, session=_http_session)
+        return ticker.history(period=period)
+    except Exception:
+        return pd.DataFrame()
+
+
+if _memory is not None:
+    _fetch_symbol_fundamentals = _memory.cache(_fetch_symbol_fundamentals)
+    _fetch_history = _memory.cache(_fetch_history)
+
+
+@njit(cache=True, fastmath=True)
+def _dcf_value(fcf: float, growth_rate: float, discount_rate: float,
+               terminal_growth: float, years: int) -> float:
+    """Present value of projected cash flows plus discounted terminal value.
+
+    Pure-numeric kernel kept free of dict/exception handling so Numba can
+    compile it on the single-symbol path; the batch path uses the
+    vectorized closed form instead.
+    """
+    pv_fcf = 0.0
+    for year in range(1, years + 1):
+        pv_fcf += fcf * (1 + growth_rate) ** year / (1 + discount_rate) ** year
+
+    terminal_fcf = fcf * (1 + growth_rate) ** years * (1 + terminal_growth)
+    terminal_value = terminal_fcf / (discount_rate - terminal_growth)
+    return pv_fcf + terminal_value / (1 + discount_rate) ** years
+
+
 class StockDataFetcher:
     """Handles fetching stock data from multiple sources"""
-    
+
+    SPARK_URL = "https://query1.finance.yahoo.com/v8/finance/spark"
+    SPARK_BATCH_SIZE = 20  # Yahoo's documented per-request symbol limit
+    FMP_QUOTE_URL = "https://financialmodelingprep.com/api/v3/quote/{}"
+    FMP_BATCH_SIZE = 100  # FMP accepts comma-joined lists of up to 100 symbols
+
     def __init__(self, alpha_key: str = None, fmp_key: str = None):
         self.alpha_key = alpha_key
         self.fmp_key = fmp_key
-        self.cache = {}
-        self.cache_duration = 3600  # 1 hour cache
-        
-    def get_stock_list(self, market: str = "us") -> List[str]:
+        self.session = _http_session  # shared keep-alive pool with retries
+
+    # Caching note: data methods use st.cache_data (leading-underscore self is
+    # excluded from the cache key), so results survive Streamlit reruns, expire
+    # on a proper TTL, and stay bounded - unlike the old per-instance dict
+    # keyed by the hour of day.
+
+    @st.cache_data(ttl=7 * 86400, show_spinner=False)
+    def get_stock_list(_self, market: str = "us") -> List[str]:
         """Get list of stock symbols based on market"""
         try:
             if market == "us":
-                # Get S&P 500 stocks as a starting point
+                # S&P 500 membership changes quarterly at most, so the parsed
+                # list is cached for a week; a bundled snapshot covers runs
+                # where Wikipedia is unreachable. Only the ticker column of
+                # the constituents table is needed, so pull just those cells
+                # with a targeted XPath rather than materializing every table
+                # on the page through pd.read_html.
                 url = "https://en.wikipedia.org/wiki/List_of_S%26P_500_companies"
-                tables = pd.read_html(url)
-                symbols = tables[0]['Symbol'].tolist()
-                return [s.replace('.', '-') for s in symbols[:100]]  # Limit to 100 for demo
+                response = _http_session.get(
+                    url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=15)
+                response.raise_for_status()
+                tree = lxml.html.fromstring(response.content)
+                symbols = [
+                    s.strip() for s in
+                    tree.xpath('//table[@id="constituents"]//tr/td[1]/a[1]/text()')
+                    if s.strip()
+                ]
+                if not symbols:
+                    raise ValueError("no symbols parsed from constituents table")
+                return [s.replace('.', '-') for s in symbols]
             else:
                 # For other markets, return a smaller sample
                 return ['MSFT', 'AAPL', 'JNJ', 'V', 'PG', 'KO', 'WMT', 'JPM', 'BAC', 'DIS']
         except Exception as e:
-            st.warning(f"Could not fetch stock list: {e}. Using default symbols.")
-            return ['MSFT', 'AAPL', 'JNJ', 'V', 'PG', 'KO', 'WMT', 'JPM', 'BAC', 'DIS']
+            st.warning(f"Could not fetch stock list: {e}. Using bundled symbols.")
+            return _load_bundled_symbols()
     
-    def get_stock_data(self, symbol: str) -> Optional[Dict]:
+    @st.cache_data(ttl=3600, max_entries=2000, show_spinner=False)
+    def get_stock_data(_self, symbol: str, compute_intrinsic: bool = True) -> Optional[Dict]:
         """Fetch comprehensive stock data using yfinance"""
-        try:
-            # Check cache
-            cache_key = f"{symbol}_{datetime.now().hour}"
-            if cache_key in self.cache:
-                return self.cache[cache_key]
-            
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
-            
-            # Get financial data
-            balance_sheet = ticker.balance_sheet
-            income_stmt = ticker.income_stmt
-            cash_flow = ticker.cashflow
-            
-            # Extract key metrics with error handling
-            data = {
-                'symbol': symbol,
-                'name': info.get('longName', symbol),
-                'price': info.get('currentPrice', info.get('regularMarketPrice', 0)),
-                'market_cap': info.get('marketCap', 0),
-                'sector': info.get('sector', 'Unknown'),
-                'industry': info.get('industry', 'Unknown'),
-                
-                # Valuation metrics
-                'pe_ratio': info.get('trailingPE', info.get('forwardPE', 0)),
-                'pb_ratio': info.get('priceToBook', 0),
-                'ps_ratio': info.get('priceToSalesTrailing12Months', 0),
-                'peg_ratio': info.get('pegRatio', 0),
-                
-                # Profitability metrics
-                'roe': info.get('returnOnEquity', 0) * 100 if info.get('returnOnEquity') else 0,
-                'roa': info.get('returnOnAssets', 0) * 100 if info.get('returnOnAssets') else 0,
-                'profit_margin': info.get('profitMargins', 0) * 100 if info.get('profitMargins') else 0,
-                'operating_margin': info.get('operatingMargins', 0) * 100 if info.get('operatingMargins') else 0,
-                'gross_margin': info.get('grossMargins', 0) * 100 if info.get('grossMargins') else 0,
-                
-                # Financial health
-                'current_ratio': info.get('currentRatio', 0),
-                'quick_ratio': info.get('quickRatio', 0),
-                'debt_to_equity': info.get('debtToEquity', 0),
-                'interest_coverage': self._calculate_interest_coverage(income_stmt),
-                
-                # Growth metrics
-                'revenue_growth': info.get('revenueGrowth', 0) * 100 if info.get('revenueGrowth') else 0,
-                'earnings_growth': info.get('earningsGrowth', 0) * 100 if info.get('earningsGrowth') else 0,
-                'earnings_quarterly_growth': info.get('earningsQuarterlyGrowth', 0) * 100 if info.get('earningsQuarterlyGrowth') else 0,
-                
-                # Dividend metrics
-                'dividend_yield': info.get('dividendYield', 0) * 100 if info.get('dividendYield') else 0,
-                'payout_ratio': info.get('payoutRatio', 0) * 100 if info.get('payoutRatio') else 0,
-                'dividend_rate': info.get('dividendRate', 0),
-                'five_year_avg_dividend_yield': info.get('fiveYearAvgDividendYield', 0),
-                
-                # Management metrics
-                'insider_ownership': info.get('heldPercentInsiders', 0) * 100 if info.get('heldPercentInsiders') else 0,
-                'institutional_ownership': info.get('heldPercentInstitutions', 0) * 100 if info.get('heldPercentInstitutions') else 0,
-                
-                # Additional data
-                'beta': info.get('beta', 1.0),
-                'fifty_two_week_high': info.get('fiftyTwoWeekHigh', 0),
-                'fifty_two_week_low': info.get('fiftyTwoWeekLow', 0),
-                'avg_volume': info.get('averageVolume', 0),
-                
-                # ESG scores (if available)
-                'esg_score': info.get('esgScores', {}).get('totalEsg', 50) if info.get('esgScores') else 50,
-                'governance_score': info.get('esgScores', {}).get('governanceScore', 50) if info.get('esgScores') else 50,
-            }
-            
-            # Calculate additional metrics
-            data['roic'] = self._calculate_roic(data, balance_sheet, income_stmt)
-            data['free_cash_flow'] = self._get_free_cash_flow(cash_flow)
-            data['intrinsic_value'] = self._calculate_intrinsic_value(data, cash_flow)
-            
-            # Cache the result
-            self.cache[cache_key] = data
-            return data
-            
-        except Exception as e:
-            st.warning(f"Error fetching data for {symbol}: {e}")
+        data = _fetch_symbol_fundamentals(symbol, date.today().isoformat())
+        if data is not None and compute_intrinsic:
+            data['intrinsic_value'] = _self._calculate_intrinsic_value(data)
+        return data
+
+    def fetch_quotes_bulk(self, symbols: List[str]) -> Dict[str, Dict]:
+        """Fetch basic quote data for many symbols in a few batched calls.
+
+        When an FMP key is configured, the /api/v3/quote endpoint returns up
+        to 100 symbols per request; otherwise Yahoo's spark endpoint covers
+        20 per request. Either way, price data for a 100-symbol screen costs
+        a handful of HTTP roundtrips instead of 100. Returns a dict mapping
+        symbol -> partial quote data; deep fundamentals still come from the
+        per-symbol yfinance path.
+        """
+        if self.fmp_key:
+            return self._fetch_quotes_fmp(symbols)
+        if aiohttp is not None:
+            try:
+                return asyncio.run(self._fetch_quotes_spark_async(symbols))
+            except Exception:
+                pass  # fall back to the sequential Session path
+        return self._fetch_quotes_spark(symbols)
+
+    @staticmethod
+    def _parse_spark_payload(payload: Dict, quotes: Dict[str, Dict]) -> None:
+        """Fold one spark response's quotes into ``quotes`` in place."""
+        for result in payload.get('spark', {}).get('result', []):
+            symbol = result.get('symbol')
+            meta = {}
+            if result.get('response'):
+                meta = result['response'][0].get('meta', {})
+            if symbol and meta:
+                quotes[symbol] = {
+                    'price': meta.get('regularMarketPrice', 0),
+                    'previous_close': meta.get('chartPreviousClose', 0),
+                }
+
+    def _fetch_quotes_spark(self, symbols: List[str]) -> Dict[str, Dict]:
+        """Sequential spark batches over the shared pooled Session."""
+        quotes = {}
+        for chunk in _chunks(symbols, self.SPARK_BATCH_SIZE):
+            try:
+                response = self.session.get(
+                    self.SPARK_URL,
+                    params={'symbols': ','.join(chunk), 'range': '1d', 'interval': '1d'},
+                    headers={'User-Agent': 'Mozilla/5.0'},
+                    timeout=10
+                )
+                response.raise_for_status()
+                payload = _json_loads(response.content)
+            except Exception:
+                continue  # quotes are a fast-path bonus, not required
+            self._parse_spark_payload(payload, quotes)
+        return quotes
+
+    async def _fetch_quotes_spark_async(self, symbols: List[str]) -> Dict[str, Dict]:
+        """All spark batches in flight at once on a single event loop.
+
+        A semaphore keeps at most 8 requests outstanding so the burst stays
+        under Yahoo's rate limiting; failed chunks are skipped just like in
+        the sequential path.
+        """
+        quotes = {}
+        semaphore = asyncio.Semaphore(8)
+
+        async def fetch_chunk(session, chunk):
+            async with semaphore:
+                async with session.get(
+                        self.SPARK_URL,
+                        params={'symbols': ','.join(chunk), 'range': '1d', 'interval': '1d'},
+                        headers={'User-Agent': 'Mozilla/5.0'}) as response:
+                    response.raise_for_status()
+                    return await response.read()
+
+        async with aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=16),
+                timeout=aiohttp.ClientTimeout(total=10)) as session:
+            payloads = await asyncio.gather(
+                *(fetch_chunk(session, chunk)
+                  for chunk in _chunks(symbols, self.SPARK_BATCH_SIZE)),
+                return_exceptions=True)
+
+        for raw in payloads:
+            if isinstance(raw, BaseException):
+                continue  # quotes are a fast-path bonus, not required
+            self._parse_spark_payload(_json_loads(raw), quotes)
+        return quotes
+
+    def _fetch_quotes_fmp(self, symbols: List[str]) -> Dict[str, Dict]:
+        """Batched quotes via the FMP quote endpoint (100 symbols/request)."""
+        quotes = {}
+        for chunk in _chunks(symbols, self.FMP_BATCH_SIZE):
+            try:
+                response = self.session.get(
+                    self.FMP_QUOTE_URL.format(','.join(chunk)),
+                    params={'apikey': self.fmp_key},
+                    timeout=10
+                )
+                response.raise_for_status()
+                payload = _json_loads(response.content)
+            except Exception:
+                continue  # quotes are a fast-path bonus, not required
+
+            for quote in payload if isinstance(payload, list) else []:
+                symbol = quote.get('symbol')
+                if symbol:
+                    quotes[symbol] = {
+                        'price': quote.get('price', 0),
+                        'previous_close': quote.get('previousClose', 0),
+                    }
+        return quotes
+
+    def iter_stock_data_chunks(self, symbols: List[str], chunk_size: int = 25,
+                               max_workers: int = 16, progress_callback=None):
+        """Fetch data concurrently and yield records in completed chunks.
+
+        The per-symbol work is almost entirely network-bound (yfinance makes
+        several HTTP roundtrips per ticker), so running the fetches on a
+        thread pool overlaps the latency across symbols. Recently fetched
+        symbols come straight out of the st.cache_data layer.
+
+        Results are consumed as futures complete and handed back
+        ``chunk_size`` records at a time, so the caller can filter and score
+        one chunk while the remaining fetches are still in flight.
+        ``progress_callback(done, total)`` is invoked after each completion
+        so callers can report progress live. Each yielded record already
+        carries its batch-computed intrinsic value.
+        """
+        to_fetch = list(symbols)
+        if not to_fetch:
+            return
+
+        def worker(symbol):
+            # Paced starts plus exponential backoff on 429s: instead of
+            # logging a warning and losing the symbol, wait out the limiter
+            # and try again.
+            for attempt in range(4):
+                _fetch_pacer.wait()
+                try:
+                    return self.get_stock_data(symbol, compute_intrinsic=False)
+                except Exception as exc:
+                    if not _is_rate_limited(exc):
+                        raise
+                    time.sleep(2 ** attempt + random.random())
+            st.warning(f"Rate limited fetching {symbol}; gave up after 4 attempts")
             return None
-    
-    def _calculate_interest_coverage(self, income_stmt) -> float:
+
+        def finalize(chunk):
+            # Intrinsic values for the chunk in one vectorized DCF pass
+            for data, value in zip(chunk, self._calculate_intrinsic_values_batch(chunk)):
+                data['intrinsic_value'] = float(value)
+            return chunk
+
+        # One batched pass over the spark endpoint gives us prices for
+        # all symbols up front; the per-symbol fetch fills in the rest.
+        quotes = self.fetch_quotes_bulk(to_fetch)
+        pending = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(worker, s): s for s in to_fetch}
+            for done, future in enumerate(as_completed(futures), start=1):
+                symbol = futures[future]
+                data = future.result()
+                if data is not None:
+                    if not data.get('price') and symbol in quotes:
+                        data['price'] = quotes[symbol]['price']
+                    pending.append(data)
+                if progress_callback is not None:
+                    progress_callback(done, len(to_fetch))
+                if len(pending) >= chunk_size:
+                    yield finalize(pending)
+                    pending = []
+        if pending:
+            yield finalize(pending)
+
+    def get_stock_data_batch(self, symbols: List[str], max_workers: int = 16,
+                             progress_callback=None) -> Dict[str, Dict]:
+        """Fetch data for many symbols concurrently, keyed by symbol."""
+        results = {}
+        for chunk in self.iter_stock_data_chunks(
+                symbols, max_workers=max_workers, progress_callback=progress_callback):
+            for data in chunk:
+                results[data['symbol']] = data
+        return results
+
+    @staticmethod
+    def _calculate_interest_coverage(income_stmt) -> float:
         """Calculate interest coverage ratio"""
         try:
             if income_stmt is None or income_stmt.empty:
@@ -217,11 +601,12 @@ class StockDataFetcher:
         except:
             return 0
     
-    def _calculate_roic(self, data: Dict, balance_sheet, income_stmt) -> float:
+    @staticmethod
+    def _calculate_roic(data: Dict, balance_sheet, income_stmt) -> float:
         """Calculate Return on Invested Capital"""
         try:
             if income_stmt is None or income_stmt.empty or balance_sheet is None or balance_sheet.empty:
-                return data.get('roe', 0) * 0.8  # Estimate from ROE
+                return (data.get('roe') or 0) * 100 * 0.8  # Estimate from ROE (raw fraction)
             
             nopat = income_stmt.loc['Net Income'].iloc[0] if 'Net Income' in income_stmt.index else 0
             total_assets = balance_sheet.loc['Total Assets'].iloc[0] if 'Total Assets' in balance_sheet.index else 1
@@ -231,9 +616,10 @@ class StockDataFetcher:
             roic = (nopat / invested_capital * 100) if invested_capital > 0 else 0
             return roic
         except:
-            return data.get('roe', 0) * 0.8
+            return (data.get('roe') or 0) * 100 * 0.8
     
-    def _get_free_cash_flow(self, cash_flow) -> float:
+    @staticmethod
+    def _get_free_cash_flow(cash_flow) -> float:
         """Get free cash flow"""
         try:
             if cash_flow is None or cash_flow.empty:
@@ -243,142 +629,327 @@ class StockDataFetcher:
         except:
             return 0
     
-    def _calculate_intrinsic_value(self, data: Dict, cash_flow) -> float:
+    @staticmethod
+    def _calculate_intrinsic_value(data: Dict) -> float:
         """Simple DCF-based intrinsic value calculation"""
         try:
-            fcf = self._get_free_cash_flow(cash_flow)
+            fcf = data.get('free_cash_flow', 0)
+            # earnings_growth arrives as a raw fraction from the fetch layer
+            growth_rate = min(data.get('earnings_growth') or 0, 0.15)
             if fcf <= 0:
                 # Use earnings-based valuation as fallback
-                eps = data['price'] / data['pe_ratio'] if data['pe_ratio'] > 0 else 0
-                growth_rate = min(data['earnings_growth'] / 100, 0.15)
+                pe = data.get('pe_ratio') or 0
+                eps = data['price'] / pe if pe > 0 else 0
                 return eps * (1 + growth_rate) * 15  # Simple PE-based valuation
-            
-            growth_rate = min(data['earnings_growth'] / 100, 0.15)
-            discount_rate = 0.10
-            terminal_growth = 0.03
-            projection_years = 5
-            
-            # Project future cash flows
-            pv_fcf = 0
-            for year in range(1, projection_years + 1):
-                future_fcf = fcf * ((1 + growth_rate) ** year)
-                pv_fcf += future_fcf / ((1 + discount_rate) ** year)
-            
-            # Terminal value
-            terminal_fcf = fcf * ((1 + growth_rate) ** projection_years) * (1 + terminal_growth)
-            terminal_value = terminal_fcf / (discount_rate - terminal_growth)
-            pv_terminal = terminal_value / ((1 + discount_rate) ** projection_years)
-            
-            enterprise_value = pv_fcf + pv_terminal
+
+            enterprise_value = _dcf_value(
+                float(fcf), growth_rate,
+                0.10,   # discount rate
+                0.03,   # terminal growth
+                5       # projection years
+            )
             shares_outstanding = data['market_cap'] / data['price'] if data['price'] > 0 else 1
             intrinsic_value = enterprise_value / shares_outstanding if shares_outstanding > 0 else data['price']
-            
+
             return max(intrinsic_value, data['price'] * 0.5)  # Floor at 50% of current price
-            
+
         except:
             return data['price']
+
+    @staticmethod
+    def _calculate_intrinsic_values_batch(records: List[Dict]) -> np.ndarray:
+        """Vectorized DCF over a batch of fetched records.
+
+        The 5-year projection loop is a geometric series, so the present
+        value collapses to a closed form; the whole batch is computed with
+        a few NumPy ufunc calls instead of a Python loop per stock.
+        """
+        fcf = np.nan_to_num(np.array([r.get('free_cash_flow', 0) for r in records], dtype=float))
+        price = np.nan_to_num(np.array([r.get('price', 0) for r in records], dtype=float))
+        pe = np.nan_to_num(np.array([r.get('pe_ratio', 0) for r in records], dtype=float))
+        market_cap = np.nan_to_num(np.array([r.get('market_cap', 0) for r in records], dtype=float))
+        earnings_growth = np.nan_to_num(
+            np.array([r.get('earnings_growth') for r in records], dtype=float))
+
+        # Raw fractions from the fetch layer, so no /100 here
+        growth = np.minimum(earnings_growth, 0.15)
+        discount = 0.10
+        terminal_growth = 0.03
+        years = 5
+
+        # sum_{y=1..n} fcf * r^y with r = (1+g)/(1+d), as a geometric series
+        r = (1 + growth) / (1 + discount)
+        pv_fcf = np.where(
+            np.abs(1 - r) < 1e-9,
+            fcf * years,
+            fcf * r * (1 - r ** years) / (1 - r))
+
+        terminal_value = fcf * (1 + growth) ** years * (1 + terminal_growth) / (discount - terminal_growth)
+        pv_terminal = terminal_value / (1 + discount) ** years
+
+        enterprise_value = pv_fcf + pv_terminal
+        shares = np.where(price > 0, market_cap / np.where(price > 0, price, 1), 1.0)
+        intrinsic = np.where(shares > 0, enterprise_value / np.where(shares > 0, shares, 1), price)
+        intrinsic = np.maximum(intrinsic, price * 0.5)  # Floor at 50% of current price
+
+        # Earnings-based fallback where there's no positive FCF
+        eps = np.where(pe > 0, price / np.where(pe > 0, pe, 1), 0.0)
+        fallback = eps * (1 + growth) * 15
+
+        return np.where(fcf > 0, intrinsic, fallback)
     
-    def get_historical_data(self, symbol: str, period: str = "1y") -> pd.DataFrame:
+    @st.cache_data(ttl=3600, show_spinner=False)
+    def get_historical_data(_self, symbol: str, period: str = "1y") -> pd.DataFrame:
         """Get historical price data"""
+        return _fetch_history(symbol, period, date.today().isoformat())
+
+    @st.cache_data(ttl=3600, show_spinner=False)
+    def get_historical_data_batch(_self, symbols: List[str], period: str = "1y") -> Dict[str, pd.DataFrame]:
+        """Get historical price data for several symbols in one download.
+
+        yf.download fetches the whole list in parallel over a single call,
+        which is much faster than one Ticker.history roundtrip per symbol.
+        """
         try:
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period=period)
-            return hist
-        except:
-            return pd.DataFrame()
+            data = yf.download(
+                list(symbols), period=period, group_by='ticker',
+                threads=True, progress=False, session=_http_session)
+        except Exception:
+            return {}
+
+        if data is None or data.empty:
+            return {}
+        if len(symbols) == 1:
+            return {symbols[0]: data}
+
+        result = {}
+        for symbol in symbols:
+            if symbol in data.columns.get_level_values(0):
+                hist = data[symbol].dropna(how='all')
+                if not hist.empty:
+                    result[symbol] = hist
+        return result
 
 
 # ============================================================================
 # SCORING ENGINE
 # ============================================================================
 
+# Threshold bands and point tables, built once at import so the hot scoring
+# path never re-allocates them. Values equal to a bin edge land in the higher
+# band for lower-inclusive metrics (>=) and in the lower band for
+# upper-inclusive ones (<=); see StockScorer._band_points.
+_PE_BINS = np.array([0, 15, 20, 25], dtype=np.float32)
+_PE_POINTS = np.array([0, 20, 15, 10, 5], dtype=np.int16)
+_PB_BINS = np.array([0, 1.5, 3, 5], dtype=np.float32)
+_PB_POINTS = np.array([4, 15, 12, 8, 4], dtype=np.int16)
+_PS_BINS = np.array([0, 1, 2, 3], dtype=np.float32)
+_PS_POINTS = np.array([4, 15, 12, 8, 4], dtype=np.int16)
+_PEG_BINS = np.array([0, 1, 1.5, 2], dtype=np.float32)
+_PEG_POINTS = np.array([5, 20, 15, 10, 5], dtype=np.int16)
+_DISCOUNT_BINS = np.array([0, 0.15, 0.30], dtype=np.float32)
+_DISCOUNT_POINTS = np.array([5, 10, 20, 30], dtype=np.int16)
+
+_CURRENT_RATIO_BINS = np.array([1, 1.5, 2], dtype=np.float32)
+_CURRENT_RATIO_POINTS = np.array([5, 15, 20, 25], dtype=np.int16)
+_QUICK_RATIO_BINS = np.array([0.5, 1, 1.5], dtype=np.float32)
+_QUICK_RATIO_POINTS = np.array([5, 10, 15, 20], dtype=np.int16)
+_DEBT_EQUITY_BINS = np.array([0.5, 1, 2], dtype=np.float32)
+_DEBT_EQUITY_POINTS = np.array([30, 25, 15, 5], dtype=np.int16)
+_COVERAGE_BINS = np.array([2, 5, 10], dtype=np.float32)
+_COVERAGE_POINTS = np.array([5, 10, 20, 25], dtype=np.int16)
+
+_PROFIT_POINTS = np.array([5, 15, 20, 25], dtype=np.int16)
+_ROE_BINS = np.array([10, 15, 20], dtype=np.float32)
+_ROIC_BINS = np.array([8, 12, 15], dtype=np.float32)
+_OP_MARGIN_BINS = np.array([10, 15, 20], dtype=np.float32)
+_NET_MARGIN_BINS = np.array([5, 10, 15], dtype=np.float32)
+
+_GROWTH_BINS = np.array([0, 5, 10, 15], dtype=np.float32)
+_GROWTH_POINTS = np.array([5, 10, 20, 30, 40], dtype=np.int16)
+_Q_GROWTH_BINS = np.array([0, 5, 15], dtype=np.float32)
+_Q_GROWTH_POINTS = np.array([5, 10, 15, 20], dtype=np.int16)
+
+_INSIDER_BINS = np.array([2, 5, 10], dtype=np.float32)
+_INSIDER_POINTS = np.array([10, 20, 30, 40], dtype=np.int16)
+_MGMT_ROE_BINS = np.array([15, 20], dtype=np.float32)
+_MGMT_ROE_POINTS = np.array([10, 20, 30], dtype=np.int16)
+
+_ESG_BINS = np.array([30, 50, 70], dtype=np.float32)
+_ESG_POINTS = np.array([10, 20, 35, 50], dtype=np.int16)
+_GOV_BINS = np.array([50, 70], dtype=np.float32)
+_GOV_POINTS = np.array([10, 20, 30], dtype=np.int16)
+
+@njit(cache=True)
+def _band_index(value: float, bins: np.ndarray, lower_inclusive: bool) -> int:
+    """Scalar counterpart of the np.digitize lookup in _band_points.
+
+    Returns the band index for one value with the same edge-inclusivity
+    convention and the same NaN-to-0 sentinel, so detail labels always
+    agree with the batch scores; compiled to native code when numba is
+    available.
+    """
+    if value != value:  # NaN
+        value = 0.0
+    idx = 0
+    for edge in bins:
+        if (value >= edge) if lower_inclusive else (value > edge):
+            idx += 1
+        else:
+            break
+    return idx
+
+
+# Category weighting for the overall score; order matches the columns
+# produced by StockScorer.score_batch.
+_SCORE_CATEGORIES = ['valuation', 'financial', 'profitability', 'growth', 'management', 'ethics']
+_SCORE_WEIGHTS = np.array([0.25, 0.20, 0.20, 0.15, 0.10, 0.10])
+
+
 class StockScorer:
     """Calculate comprehensive quality scores for stocks"""
-    
+
+    @staticmethod
+    def _band_points(values, bins, points, lower_inclusive=True):
+        """Map values onto banded points via a sorted-threshold lookup.
+
+        Replaces the per-stock if/elif ladders with one branchless
+        np.digitize pass over the whole column. ``lower_inclusive=True``
+        means a value equal to a threshold falls in the higher band (e.g.
+        ROE >= 20), while ``False`` keeps it in the lower band (e.g.
+        P/E <= 15). NaNs are mapped to 0 up front as the sentinel for
+        missing data - np.digitize would otherwise sort them above every
+        finite edge and hand them the top band.
+        """
+        values = np.asarray(values, dtype=float)
+        values = np.where(np.isnan(values), 0.0, values)
+        idx = np.digitize(values, bins, right=not lower_inclusive)
+        return np.asarray(points)[idx]
+
+    @classmethod
+    def score_batch(cls, df: pd.DataFrame, ethical_profile: str) -> pd.DataFrame:
+        """Score all stocks in one vectorized pass.
+
+        Produces the same category scores as the per-stock calculate_*
+        methods, but as column operations over a metrics DataFrame - the
+        thousands of Python branches become a handful of NumPy lookups.
+        """
+        band = cls._band_points
+
+        # Valuation
+        valuation = (
+            band(df['pe_ratio'], _PE_BINS, _PE_POINTS, lower_inclusive=False)
+            + band(df['pb_ratio'], _PB_BINS, _PB_POINTS, lower_inclusive=False)
+            + band(df['ps_ratio'], _PS_BINS, _PS_POINTS, lower_inclusive=False)
+            + band(df['peg_ratio'], _PEG_BINS, _PEG_POINTS, lower_inclusive=False)
+        )
+        price = np.nan_to_num(df['price'].to_numpy(dtype=float))
+        intrinsic = np.nan_to_num(df['intrinsic_value'].to_numpy(dtype=float))
+        valid = (price > 0) & (intrinsic > 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            discount = np.where(valid, (intrinsic - price) / np.where(valid, intrinsic, 1), 0)
+        valuation = valuation + np.where(
+            valid, band(discount, _DISCOUNT_BINS, _DISCOUNT_POINTS), 0)
+        valuation = np.minimum(valuation, 100)
+
+        # Financial health
+        financial = np.minimum(
+            band(df['current_ratio'], _CURRENT_RATIO_BINS, _CURRENT_RATIO_POINTS)
+            + band(df['quick_ratio'], _QUICK_RATIO_BINS, _QUICK_RATIO_POINTS)
+            + band(df['debt_to_equity'], _DEBT_EQUITY_BINS, _DEBT_EQUITY_POINTS, lower_inclusive=False)
+            + band(df['interest_coverage'], _COVERAGE_BINS, _COVERAGE_POINTS),
+            100)
+
+        # Profitability
+        profitability = np.minimum(
+            band(df['roe'], _ROE_BINS, _PROFIT_POINTS)
+            + band(df['roic'], _ROIC_BINS, _PROFIT_POINTS)
+            + band(df['operating_margin'], _OP_MARGIN_BINS, _PROFIT_POINTS)
+            + band(df['profit_margin'], _NET_MARGIN_BINS, _PROFIT_POINTS),
+            100)
+
+        # Growth
+        growth = np.minimum(
+            band(df['earnings_growth'], _GROWTH_BINS, _GROWTH_POINTS)
+            + band(df['revenue_growth'], _GROWTH_BINS, _GROWTH_POINTS)
+            + band(df['earnings_quarterly_growth'], _Q_GROWTH_BINS, _Q_GROWTH_POINTS),
+            100)
+
+        # Management
+        institutional = np.nan_to_num(df['institutional_ownership'].to_numpy(dtype=float))
+        institutional_points = np.where(
+            (institutional >= 40) & (institutional <= 80), 30,
+            np.where((institutional >= 20) & (institutional <= 90), 20, 10))
+        management = np.minimum(
+            band(df['insider_ownership'], _INSIDER_BINS, _INSIDER_POINTS)
+            + institutional_points
+            + band(df['roe'], _MGMT_ROE_BINS, _MGMT_ROE_POINTS),
+            100)
+
+        # Ethics
+        ethics = (
+            50
+            + band(df['esg_score'], _ESG_BINS, _ESG_POINTS)
+            + band(df['governance_score'], _GOV_BINS, _GOV_POINTS)
+        ).astype(float)
+        if ethical_profile == 'conservative':
+            ethics *= 0.9
+        elif ethical_profile == 'flexible':
+            ethics *= 1.1
+        ethics = np.minimum(ethics, 100)
+
+        return pd.DataFrame({
+            'valuation': valuation,
+            'financial': financial,
+            'profitability': profitability,
+            'growth': growth,
+            'management': management,
+            'ethics': ethics,
+        }, index=df.index)
+
     @staticmethod
     def calculate_valuation_score(data: Dict) -> Tuple[float, Dict]:
         """Score based on valuation metrics"""
         score = 0
         details = {}
-        
-        # P/E Ratio (20 points)
-        pe = data.get('pe_ratio', 0)
-        if 0 < pe <= 15:
-            score += 20
-            details['pe'] = 'Excellent'
-        elif 15 < pe <= 20:
-            score += 15
-            details['pe'] = 'Good'
-        elif 20 < pe <= 25:
-            score += 10
-            details['pe'] = 'Fair'
-        elif pe > 25:
-            score += 5
-            details['pe'] = 'High'
-        
+
+        # P/E Ratio (20 points); non-positive P/E earns no points or label
+        idx = _band_index(data.get('pe_ratio', 0), _PE_BINS, False)
+        score += int(_PE_POINTS[idx])
+        if idx > 0:
+            details['pe'] = ('Excellent', 'Good', 'Fair', 'High')[idx - 1]
+
         # P/B Ratio (15 points)
-        pb = data.get('pb_ratio', 0)
-        if 0 < pb <= 1.5:
-            score += 15
-            details['pb'] = 'Excellent'
-        elif 1.5 < pb <= 3:
-            score += 12
-            details['pb'] = 'Good'
-        elif 3 < pb <= 5:
-            score += 8
-            details['pb'] = 'Fair'
-        else:
-            score += 4
-            details['pb'] = 'High'
-        
+        idx = _band_index(data.get('pb_ratio', 0), _PB_BINS, False)
+        score += int(_PB_POINTS[idx])
+        details['pb'] = ('High', 'Excellent', 'Good', 'Fair', 'High')[idx]
+
         # P/S Ratio (15 points)
-        ps = data.get('ps_ratio', 0)
-        if 0 < ps <= 1:
-            score += 15
-            details['ps'] = 'Excellent'
-        elif 1 < ps <= 2:
-            score += 12
-            details['ps'] = 'Good'
-        elif 2 < ps <= 3:
-            score += 8
-            details['ps'] = 'Fair'
-        else:
-            score += 4
-            details['ps'] = 'High'
-        
+        idx = _band_index(data.get('ps_ratio', 0), _PS_BINS, False)
+        score += int(_PS_POINTS[idx])
+        details['ps'] = ('High', 'Excellent', 'Good', 'Fair', 'High')[idx]
+
         # Intrinsic Value vs Price (30 points)
         price = data.get('price', 0)
         intrinsic = data.get('intrinsic_value', 0)
         if price > 0 and intrinsic > 0:
             discount = (intrinsic - price) / intrinsic
-            if discount >= 0.30:
-                score += 30
-                details['valuation'] = f'Undervalued by {discount*100:.1f}%'
-            elif discount >= 0.15:
-                score += 20
-                details['valuation'] = f'Undervalued by {discount*100:.1f}%'
-            elif discount >= 0:
-                score += 10
+            idx = _band_index(discount, _DISCOUNT_BINS, True)
+            score += int(_DISCOUNT_POINTS[idx])
+            if idx == 0:
+                details['valuation'] = f'Overvalued by {abs(discount)*100:.1f}%'
+            elif idx == 1:
                 details['valuation'] = 'Fair value'
             else:
-                score += 5
-                details['valuation'] = f'Overvalued by {abs(discount)*100:.1f}%'
-        
+                details['valuation'] = f'Undervalued by {discount*100:.1f}%'
+
         # PEG Ratio (20 points)
-        peg = data.get('peg_ratio', 0)
-        if 0 < peg <= 1:
-            score += 20
-            details['peg'] = 'Excellent growth value'
-        elif 1 < peg <= 1.5:
-            score += 15
-            details['peg'] = 'Good growth value'
-        elif 1.5 < peg <= 2:
-            score += 10
-            details['peg'] = 'Fair growth value'
-        else:
-            score += 5
-            details['peg'] = 'Expensive growth'
-        
+        idx = _band_index(data.get('peg_ratio', 0), _PEG_BINS, False)
+        score += int(_PEG_POINTS[idx])
+        details['peg'] = ('Expensive growth', 'Excellent growth value',
+                          'Good growth value', 'Fair growth value',
+                          'Expensive growth')[idx]
+
         return min(score, 100), details
     
     @staticmethod
@@ -386,67 +957,27 @@ class StockScorer:
         """Score based on financial health"""
         score = 0
         details = {}
-        
+
         # Current Ratio (25 points)
-        current_ratio = data.get('current_ratio', 0)
-        if current_ratio >= 2:
-            score += 25
-            details['liquidity'] = 'Excellent'
-        elif current_ratio >= 1.5:
-            score += 20
-            details['liquidity'] = 'Good'
-        elif current_ratio >= 1:
-            score += 15
-            details['liquidity'] = 'Adequate'
-        else:
-            score += 5
-            details['liquidity'] = 'Weak'
-        
+        idx = _band_index(data.get('current_ratio', 0), _CURRENT_RATIO_BINS, True)
+        score += int(_CURRENT_RATIO_POINTS[idx])
+        details['liquidity'] = ('Weak', 'Adequate', 'Good', 'Excellent')[idx]
+
         # Quick Ratio (20 points)
-        quick_ratio = data.get('quick_ratio', 0)
-        if quick_ratio >= 1.5:
-            score += 20
-            details['quick_liquidity'] = 'Strong'
-        elif quick_ratio >= 1:
-            score += 15
-            details['quick_liquidity'] = 'Good'
-        elif quick_ratio >= 0.5:
-            score += 10
-            details['quick_liquidity'] = 'Fair'
-        else:
-            score += 5
-            details['quick_liquidity'] = 'Weak'
-        
+        idx = _band_index(data.get('quick_ratio', 0), _QUICK_RATIO_BINS, True)
+        score += int(_QUICK_RATIO_POINTS[idx])
+        details['quick_liquidity'] = ('Weak', 'Fair', 'Good', 'Strong')[idx]
+
         # Debt-to-Equity (30 points)
-        de = data.get('debt_to_equity', 0)
-        if de <= 0.5:
-            score += 30
-            details['leverage'] = 'Conservative'
-        elif de <= 1:
-            score += 25
-            details['leverage'] = 'Moderate'
-        elif de <= 2:
-            score += 15
-            details['leverage'] = 'Elevated'
-        else:
-            score += 5
-            details['leverage'] = 'High risk'
-        
+        idx = _band_index(data.get('debt_to_equity', 0), _DEBT_EQUITY_BINS, False)
+        score += int(_DEBT_EQUITY_POINTS[idx])
+        details['leverage'] = ('Conservative', 'Moderate', 'Elevated', 'High risk')[idx]
+
         # Interest Coverage (25 points)
-        coverage = data.get('interest_coverage', 0)
-        if coverage >= 10:
-            score += 25
-            details['interest_coverage'] = 'Excellent'
-        elif coverage >= 5:
-            score += 20
-            details['interest_coverage'] = 'Good'
-        elif coverage >= 2:
-            score += 10
-            details['interest_coverage'] = 'Adequate'
-        else:
-            score += 5
-            details['interest_coverage'] = 'Weak'
-        
+        idx = _band_index(data.get('interest_coverage', 0), _COVERAGE_BINS, True)
+        score += int(_COVERAGE_POINTS[idx])
+        details['interest_coverage'] = ('Weak', 'Adequate', 'Good', 'Excellent')[idx]
+
         return min(score, 100), details
     
     @staticmethod
@@ -454,67 +985,18 @@ class StockScorer:
         """Score based on profitability metrics"""
         score = 0
         details = {}
-        
-        # ROE (25 points)
-        roe = data.get('roe', 0)
-        if roe >= 20:
-            score += 25
-            details['roe'] = 'Excellent'
-        elif roe >= 15:
-            score += 20
-            details['roe'] = 'Good'
-        elif roe >= 10:
-            score += 15
-            details['roe'] = 'Fair'
-        else:
-            score += 5
-            details['roe'] = 'Weak'
-        
-        # ROIC (25 points)
-        roic = data.get('roic', 0)
-        if roic >= 15:
-            score += 25
-            details['roic'] = 'Excellent'
-        elif roic >= 12:
-            score += 20
-            details['roic'] = 'Good'
-        elif roic >= 8:
-            score += 15
-            details['roic'] = 'Fair'
-        else:
-            score += 5
-            details['roic'] = 'Weak'
-        
-        # Operating Margin (25 points)
-        op_margin = data.get('operating_margin', 0)
-        if op_margin >= 20:
-            score += 25
-            details['op_margin'] = 'Excellent'
-        elif op_margin >= 15:
-            score += 20
-            details['op_margin'] = 'Good'
-        elif op_margin >= 10:
-            score += 15
-            details['op_margin'] = 'Fair'
-        else:
-            score += 5
-            details['op_margin'] = 'Weak'
-        
-        # Net Margin (25 points)
-        net_margin = data.get('profit_margin', 0)
-        if net_margin >= 15:
-            score += 25
-            details['net_margin'] = 'Excellent'
-        elif net_margin >= 10:
-            score += 20
-            details['net_margin'] = 'Good'
-        elif net_margin >= 5:
-            score += 15
-            details['net_margin'] = 'Fair'
-        else:
-            score += 5
-            details['net_margin'] = 'Weak'
-        
+        labels = ('Weak', 'Fair', 'Good', 'Excellent')
+
+        # ROE / ROIC / Operating Margin / Net Margin (25 points each)
+        for key, field, bins in (
+                ('roe', 'roe', _ROE_BINS),
+                ('roic', 'roic', _ROIC_BINS),
+                ('op_margin', 'operating_margin', _OP_MARGIN_BINS),
+                ('net_margin', 'profit_margin', _NET_MARGIN_BINS)):
+            idx = _band_index(data.get(field, 0), bins, True)
+            score += int(_PROFIT_POINTS[idx])
+            details[key] = labels[idx]
+
         return min(score, 100), details
     
     @staticmethod
@@ -522,58 +1004,23 @@ class StockScorer:
         """Score based on growth metrics"""
         score = 0
         details = {}
-        
+        growth_labels = ('Declining', 'Slow', 'Moderate', 'Good', 'Excellent')
+
         # Earnings Growth (40 points)
-        earnings_growth = data.get('earnings_growth', 0)
-        if earnings_growth >= 15:
-            score += 40
-            details['earnings_growth'] = 'Excellent'
-        elif earnings_growth >= 10:
-            score += 30
-            details['earnings_growth'] = 'Good'
-        elif earnings_growth >= 5:
-            score += 20
-            details['earnings_growth'] = 'Moderate'
-        elif earnings_growth >= 0:
-            score += 10
-            details['earnings_growth'] = 'Slow'
-        else:
-            score += 5
-            details['earnings_growth'] = 'Declining'
-        
+        idx = _band_index(data.get('earnings_growth', 0), _GROWTH_BINS, True)
+        score += int(_GROWTH_POINTS[idx])
+        details['earnings_growth'] = growth_labels[idx]
+
         # Revenue Growth (40 points)
-        revenue_growth = data.get('revenue_growth', 0)
-        if revenue_growth >= 15:
-            score += 40
-            details['revenue_growth'] = 'Excellent'
-        elif revenue_growth >= 10:
-            score += 30
-            details['revenue_growth'] = 'Good'
-        elif revenue_growth >= 5:
-            score += 20
-            details['revenue_growth'] = 'Moderate'
-        elif revenue_growth >= 0:
-            score += 10
-            details['revenue_growth'] = 'Slow'
-        else:
-            score += 5
-            details['revenue_growth'] = 'Declining'
-        
+        idx = _band_index(data.get('revenue_growth', 0), _GROWTH_BINS, True)
+        score += int(_GROWTH_POINTS[idx])
+        details['revenue_growth'] = growth_labels[idx]
+
         # Quarterly Growth (20 points)
-        q_growth = data.get('earnings_quarterly_growth', 0)
-        if q_growth >= 15:
-            score += 20
-            details['quarterly_momentum'] = 'Strong'
-        elif q_growth >= 5:
-            score += 15
-            details['quarterly_momentum'] = 'Positive'
-        elif q_growth >= 0:
-            score += 10
-            details['quarterly_momentum'] = 'Stable'
-        else:
-            score += 5
-            details['quarterly_momentum'] = 'Weak'
-        
+        idx = _band_index(data.get('earnings_quarterly_growth', 0), _Q_GROWTH_BINS, True)
+        score += int(_Q_GROWTH_POINTS[idx])
+        details['quarterly_momentum'] = ('Weak', 'Stable', 'Positive', 'Strong')[idx]
+
         return min(score, 100), details
     
     @staticmethod
@@ -583,21 +1030,12 @@ class StockScorer:
         details = {}
         
         # Insider Ownership (40 points)
-        insider = data.get('insider_ownership', 0)
-        if insider >= 10:
-            score += 40
-            details['insider_alignment'] = 'Excellent'
-        elif insider >= 5:
-            score += 30
-            details['insider_alignment'] = 'Good'
-        elif insider >= 2:
-            score += 20
-            details['insider_alignment'] = 'Moderate'
-        else:
-            score += 10
-            details['insider_alignment'] = 'Low'
-        
-        # Institutional Ownership (30 points)
+        idx = _band_index(data.get('insider_ownership', 0), _INSIDER_BINS, True)
+        score += int(_INSIDER_POINTS[idx])
+        details['insider_alignment'] = ('Low', 'Moderate', 'Good', 'Excellent')[idx]
+
+        # Institutional Ownership (30 points) - the optimal band sits in the
+        # middle, so this one stays a pair of range checks
         institutional = data.get('institutional_ownership', 0)
         if 40 <= institutional <= 80:
             score += 30
@@ -608,19 +1046,12 @@ class StockScorer:
         else:
             score += 10
             details['institutional'] = 'Suboptimal'
-        
+
         # ROE as proxy for management efficiency (30 points)
-        roe = data.get('roe', 0)
-        if roe >= 20:
-            score += 30
-            details['efficiency'] = 'Excellent'
-        elif roe >= 15:
-            score += 20
-            details['efficiency'] = 'Good'
-        else:
-            score += 10
-            details['efficiency'] = 'Fair'
-        
+        idx = _band_index(data.get('roe', 0), _MGMT_ROE_BINS, True)
+        score += int(_MGMT_ROE_POINTS[idx])
+        details['efficiency'] = ('Fair', 'Good', 'Excellent')[idx]
+
         return min(score, 100), details
     
     @staticmethod
@@ -630,32 +1061,15 @@ class StockScorer:
         details = {}
         
         # ESG Score (50 points)
-        esg = data.get('esg_score', 50)
-        if esg >= 70:
-            score += 50
-            details['esg'] = 'Leader'
-        elif esg >= 50:
-            score += 35
-            details['esg'] = 'Average'
-        elif esg >= 30:
-            score += 20
-            details['esg'] = 'Below average'
-        else:
-            score += 10
-            details['esg'] = 'Laggard'
-        
+        idx = _band_index(data.get('esg_score', 50), _ESG_BINS, True)
+        score += int(_ESG_POINTS[idx])
+        details['esg'] = ('Laggard', 'Below average', 'Average', 'Leader')[idx]
+
         # Governance Score (30 points)
-        gov = data.get('governance_score', 50)
-        if gov >= 70:
-            score += 30
-            details['governance'] = 'Strong'
-        elif gov >= 50:
-            score += 20
-            details['governance'] = 'Adequate'
-        else:
-            score += 10
-            details['governance'] = 'Weak'
-        
+        idx = _band_index(data.get('governance_score', 50), _GOV_BINS, True)
+        score += int(_GOV_POINTS[idx])
+        details['governance'] = ('Weak', 'Adequate', 'Strong')[idx]
+
         # Adjust based on ethical profile
         if ethical_profile == 'conservative':
             score *= 0.9  # Stricter standards
@@ -667,21 +1081,38 @@ class StockScorer:
         
         return min(score, 100), details
     
+    @classmethod
+    def score_details(cls, data: Dict, ethical_profile: str) -> Dict[str, Dict]:
+        """Build the human-readable detail labels for a single stock.
+
+        The batch path deliberately skips these strings; the detail view
+        calls this for just the stock being inspected.
+        """
+        return {
+            'valuation': cls.calculate_valuation_score(data)[1],
+            'financial': cls.calculate_financial_score(data)[1],
+            'profitability': cls.calculate_profitability_score(data)[1],
+            'growth': cls.calculate_growth_score(data)[1],
+            'management': cls.calculate_management_score(data)[1],
+            'ethics': cls.calculate_ethics_score(data, ethical_profile)[1],
+        }
+
     @staticmethod
     def calculate_overall_score(scores: Dict) -> float:
         """Calculate weighted overall score"""
-        weights = {
-            'valuation': 0.25,
-            'financial': 0.20,
-            'profitability': 0.20,
-            'growth': 0.15,
-            'management': 0.10,
-            'ethics': 0.10
-        }
-        
-        overall = sum(scores[key] * weights[key] for key in weights)
+        overall = sum(scores[cat] * w for cat, w in zip(_SCORE_CATEGORIES, _SCORE_WEIGHTS))
         return round(overall, 1)
 
+    @staticmethod
+    def calculate_overall_scores_batch(category_scores: pd.DataFrame) -> np.ndarray:
+        """Weighted overall scores for a whole batch as one matrix product.
+
+        An (N, 6) score matrix against the (6,) weight vector is a single
+        BLAS call - no per-stock Python arithmetic.
+        """
+        matrix = category_scores[_SCORE_CATEGORIES].to_numpy(dtype=float)
+        return np.round(matrix @ _SCORE_WEIGHTS, 1)
+
 
 # ============================================================================
 # STREAMLIT UI
@@ -695,6 +1126,8 @@ def main():
     # Initialize session state
     if 'results' not in st.session_state:
         st.session_state.results = None
+    if 'results_by_symbol' not in st.session_state:
+        st.session_state.results_by_symbol = {}
     if 'comparison_list' not in st.session_state:
         st.session_state.comparison_list = []
     if 'fetcher' not in st.session_state:
@@ -855,82 +1288,120 @@ def main():
             st.info("Run a screening first to view detailed stock analysis.")
 
 
+# Metric columns downcast to float32 once the metrics frame is built. The
+# scoring thresholds carry at most a couple of significant figures, so
+# half-width floats lose nothing while halving memory traffic through the
+# vectorized stages. Large-magnitude columns (market_cap, free_cash_flow,
+# avg_volume) stay float64.
+_FLOAT32_METRIC_COLS = [
+    'price', 'pe_ratio', 'pb_ratio', 'ps_ratio', 'peg_ratio',
+    'roe', 'roa', 'roic', 'profit_margin', 'operating_margin', 'gross_margin',
+    'current_ratio', 'quick_ratio', 'debt_to_equity', 'interest_coverage',
+    'revenue_growth', 'earnings_growth', 'earnings_quarterly_growth',
+    'dividend_yield', 'payout_ratio', 'dividend_rate',
+    'five_year_avg_dividend_yield', 'insider_ownership',
+    'institutional_ownership', 'beta', 'fifty_two_week_high',
+    'fifty_two_week_low', 'esg_score', 'governance_score', 'intrinsic_value',
+]
+
+# Columns the fetch layer delivers as raw fractions (Yahoo's convention);
+# scaled to percent in one column op instead of a branchy conversion per
+# field per symbol.
+_PERCENT_COLS = [
+    'roe', 'roa', 'profit_margin', 'operating_margin', 'gross_margin',
+    'revenue_growth', 'earnings_growth', 'earnings_quarterly_growth',
+    'dividend_yield', 'payout_ratio', 'insider_ownership',
+    'institutional_ownership',
+]
+
+
+def _prepare_metrics_frame(metrics_df: pd.DataFrame) -> pd.DataFrame:
+    """Percent scaling and missing-value defaults as column ops.
+
+    Raw fractions from the fetch layer become percentages, absent ESG data
+    falls back to the neutral 50, and remaining gaps coalesce to 0.
+    """
+    percent_cols = [c for c in _PERCENT_COLS if c in metrics_df.columns]
+    metrics_df[percent_cols] = metrics_df[percent_cols].astype(float).fillna(0) * 100
+    metrics_df[['esg_score', 'governance_score']] = (
+        metrics_df[['esg_score', 'governance_score']].fillna(50))
+
+    float_cols = [c for c in _FLOAT32_METRIC_COLS if c in metrics_df.columns]
+    metrics_df[float_cols] = metrics_df[float_cols].astype(float).fillna(0).astype(np.float32)
+    return metrics_df
+
+
+def _score_chunk(chunk: List[Dict], criteria: Dict) -> Optional[pd.DataFrame]:
+    """Prepare, filter and score one fetched chunk; None if nothing passes.
+
+    Columnar throughout: the chunk's records go into one DataFrame (rows =
+    symbols, columns = metrics) that feeds filtering and scoring as column
+    operations. Human-readable details are not built here - the detail view
+    derives them on demand for the one stock being inspected.
+    """
+    metrics_df = _prepare_metrics_frame(pd.DataFrame.from_records(chunk))
+    keep = passes_filters_batch(metrics_df, criteria)
+    survivors = metrics_df.loc[keep].reset_index(drop=True)
+    if survivors.empty:
+        return None
+
+    category_scores = StockScorer.score_batch(survivors, criteria['ethical_profile'])
+    overall_scores = StockScorer.calculate_overall_scores_batch(category_scores)
+    return survivors.assign(
+        overall_score=overall_scores,
+        **{f'{cat}_score': category_scores[cat].to_numpy()
+           for cat in _SCORE_CATEGORIES})
+
+
 def run_screening(fetcher: StockDataFetcher, market: str, criteria: Dict):
     """Execute the stock screening process"""
-    
+
     with st.spinner("🔍 Fetching stock list..."):
         symbols = fetcher.get_stock_list(market)
         st.info(f"Analyzing {len(symbols)} stocks...")
-    
+
     results = []
     progress_bar = st.progress(0)
     status_text = st.empty()
-    
-    for i, symbol in enumerate(symbols):
-        status_text.text(f"Analyzing {symbol}... ({i+1}/{len(symbols)})")
-        progress_bar.progress((i + 1) / len(symbols))
-        
-        # Fetch data
-        data = fetcher.get_stock_data(symbol)
-        if data is None:
-            continue
-        
-        # Apply filters
-        if not passes_filters(data, criteria):
-            continue
-        
-        # Calculate scores
-        scorer = StockScorer()
-        valuation_score, val_details = scorer.calculate_valuation_score(data)
-        financial_score, fin_details = scorer.calculate_financial_score(data)
-        profit_score, prof_details = scorer.calculate_profitability_score(data)
-        growth_score, growth_details = scorer.calculate_growth_score(data)
-        mgmt_score, mgmt_details = scorer.calculate_management_score(data)
-        ethics_score, eth_details = scorer.calculate_ethics_score(data, criteria['ethical_profile'])
-        
-        scores = {
-            'valuation': valuation_score,
-            'financial': financial_score,
-            'profitability': profit_score,
-            'growth': growth_score,
-            'management': mgmt_score,
-            'ethics': ethics_score
-        }
-        
-        overall_score = scorer.calculate_overall_score(scores)
-        
-        # Store result
-        result = {
-            **data,
-            'overall_score': overall_score,
-            'valuation_score': valuation_score,
-            'financial_score': financial_score,
-            'profitability_score': profit_score,
-            'growth_score': growth_score,
-            'management_score': mgmt_score,
-            'ethics_score': ethics_score,
-            'score_details': {
-                'valuation': val_details,
-                'financial': fin_details,
-                'profitability': prof_details,
-                'growth': growth_details,
-                'management': mgmt_details,
-                'ethics': eth_details
-            }
-        }
-        
-        results.append(result)
-        
-        # Rate limiting
-        time.sleep(0.1)
-    
+
+    # Fetch all symbols concurrently - this is the network-bound part that
+    # dominates screening time when done serially.
+    status_text.text(f"Fetching data for {len(symbols)} stocks...")
+
+    # Each widget update is a synchronous roundtrip to the browser, so only
+    # repaint every ~5% of progress rather than on every completed symbol.
+    update_every = max(1, len(symbols) // 20)
+
+    def on_progress(done, total):
+        if done % update_every == 0 or done == total:
+            status_text.text(f"Fetching data... ({done}/{total})")
+            progress_bar.progress(done / total)
+
+    # Pipelined fetch/score: each completed chunk is filtered and scored on
+    # the main thread while the executor keeps the remaining fetches in
+    # flight, hiding the CPU stages behind network latency.
+    scored_frames = []
+    for chunk in fetcher.iter_stock_data_chunks(symbols, progress_callback=on_progress):
+        scored = _score_chunk(chunk, criteria)
+        if scored is not None:
+            scored_frames.append(scored)
+
+    if scored_frames:
+        # Sort while everything is still columnar; the per-row dicts are
+        # only materialized at the end.
+        results = (pd.concat(scored_frames, ignore_index=True)
+                   .sort_values('overall_score', ascending=False, kind='stable')
+                   .to_dict('records'))
+
     progress_bar.empty()
     status_text.empty()
-    
+
     if len(results) > 0:
-        # Sort by overall score
-        results.sort(key=lambda x: x['overall_score'], reverse=True)
         st.session_state.results = results
+        # O(1) lookup index for the detail and comparison views
+        st.session_state.results_by_symbol = {r['symbol']: r for r in results}
+        # Remembered so lazily-built score details use the same profile
+        st.session_state.ethical_profile = criteria['ethical_profile']
         st.success(f"✅ Found {len(results)} high-quality stocks matching your criteria!")
         st.balloons()
     else:
@@ -939,98 +1410,200 @@ def run_screening(fetcher: StockDataFetcher, market: str, criteria: Dict):
 
 def passes_filters(data: Dict, criteria: Dict) -> bool:
     """Check if stock passes all screening criteria"""
-    
-    # Valuation filters
-    if data.get('pe_ratio', 0) > criteria['max_pe'] and data.get('pe_ratio', 0) > 0:
-        return False
-    if data.get('pb_ratio', 0) > criteria['max_pb'] and data.get('pb_ratio', 0) > 0:
-        return False
-    
-    # Discount to intrinsic value
+
+    # Pull every metric out of the dict once up front; a few were
+    # previously looked up twice within a single comparison.
+    pe = data.get('pe_ratio', 0)
+    pb = data.get('pb_ratio', 0)
     price = data.get('price', 0)
     intrinsic = data.get('intrinsic_value', 0)
-    if price > 0 and intrinsic > 0:
-        discount = (intrinsic - price) / intrinsic * 100
-        if discount < criteria['min_discount']:
-            return False
-    
+    current_ratio = data.get('current_ratio', 0)
+    debt_to_equity = data.get('debt_to_equity', 999)
+    interest_coverage = data.get('interest_coverage', 0)
+    roe = data.get('roe', 0)
+    roic = data.get('roic', 0)
+    operating_margin = data.get('operating_margin', 0)
+    earnings_growth = data.get('earnings_growth', -999)
+    revenue_growth = data.get('revenue_growth', -999)
+    dividend_yield = data.get('dividend_yield', 0)
+
+    # Checks ordered by typical rejection rate (most stocks fail on the
+    # fundamentals thresholds) with the division-bearing intrinsic-value
+    # check last; the criteria are ANDed so order never changes the result.
+
     # Financial health
-    if data.get('current_ratio', 0) < criteria['min_current_ratio']:
+    if current_ratio < criteria['min_current_ratio']:
         return False
-    if data.get('debt_to_equity', 999) > criteria['max_debt_equity']:
+    if roe < criteria['min_roe']:
         return False
-    if data.get('interest_coverage', 0) < criteria['min_interest_cov']:
+    if interest_coverage < criteria['min_interest_cov']:
         return False
-    
-    # Profitability
-    if data.get('roe', 0) < criteria['min_roe']:
+    if debt_to_equity > criteria['max_debt_equity']:
         return False
-    if data.get('roic', 0) < criteria['min_roic']:
+
+    # Profitability
+    if operating_margin < criteria['min_op_margin']:
         return False
-    if data.get('operating_margin', 0) < criteria['min_op_margin']:
+    if roic < criteria['min_roic']:
         return False
-    
+
     # Growth
-    if data.get('earnings_growth', -999) < criteria['min_earnings_growth']:
+    if earnings_growth < criteria['min_earnings_growth']:
         return False
-    if data.get('revenue_growth', -999) < criteria['min_revenue_growth']:
+    if revenue_growth < criteria['min_revenue_growth']:
         return False
-    
+
     # Dividend
     if criteria['dividend_req'] == 'paying':
-        if data.get('dividend_yield', 0) < criteria['min_div_yield']:
+        if dividend_yield < criteria['min_div_yield']:
             return False
     elif criteria['dividend_req'] == 'growing':
-        if data.get('dividend_yield', 0) < criteria['min_div_yield']:
+        if dividend_yield < criteria['min_div_yield']:
             return False
         if data.get('five_year_avg_dividend_yield', 0) == 0:
             return False
-    
+
+    # Valuation filters
+    if pe > criteria['max_pe'] and pe > 0:
+        return False
+    if pb > criteria['max_pb'] and pb > 0:
+        return False
+
+    # Discount to intrinsic value
+    if price > 0 and intrinsic > 0:
+        discount = (intrinsic - price) / intrinsic * 100
+        if discount < criteria['min_discount']:
+            return False
+
     return True
 
 
+def passes_filters_batch(df: pd.DataFrame, criteria: Dict) -> np.ndarray:
+    """Vectorized ``passes_filters``: one boolean mask over all stocks.
+
+    Applies the same criteria as the scalar version but as chained column
+    comparisons - one C-level pass per condition instead of ~15 Python
+    comparisons per stock. Expects the prepared metrics frame, where
+    missing values have already been coalesced to their defaults.
+    """
+    def col(name, default=0.0):
+        if name in df.columns:
+            return df[name].to_numpy(dtype=np.float64)
+        return np.full(len(df), default)
+
+    pe = col('pe_ratio')
+    pb = col('pb_ratio')
+    mask = ~((pe > criteria['max_pe']) & (pe > 0))
+    mask &= ~((pb > criteria['max_pb']) & (pb > 0))
+
+    # Discount to intrinsic value only applies where both sides are known
+    price = col('price')
+    intrinsic = col('intrinsic_value')
+    valid = (price > 0) & (intrinsic > 0)
+    discount = (intrinsic - price) / np.where(valid, intrinsic, 1.0) * 100
+    mask &= ~(valid & (discount < criteria['min_discount']))
+
+    mask &= col('current_ratio') >= criteria['min_current_ratio']
+    mask &= col('debt_to_equity') <= criteria['max_debt_equity']
+    mask &= col('interest_coverage') >= criteria['min_interest_cov']
+
+    mask &= col('roe') >= criteria['min_roe']
+    mask &= col('roic') >= criteria['min_roic']
+    mask &= col('operating_margin') >= criteria['min_op_margin']
+
+    mask &= col('earnings_growth') >= criteria['min_earnings_growth']
+    mask &= col('revenue_growth') >= criteria['min_revenue_growth']
+
+    if criteria['dividend_req'] in ('paying', 'growing'):
+        mask &= col('dividend_yield') >= criteria['min_div_yield']
+    if criteria['dividend_req'] == 'growing':
+        mask &= col('five_year_avg_dividend_yield') != 0
+
+    return mask
+
+
+@st.cache_data(show_spinner=False)
+def _build_display_df(_results: List[Dict], results_token: int) -> pd.DataFrame:
+    """Build the results table columnwise, once per screening run.
+
+    Streamlit reruns the whole script on every widget interaction, so this
+    would otherwise repeat on every multiselect click or tab switch.
+    ``results_token`` is a cheap content hash keying the cache; the results
+    list itself is excluded via the leading underscore.
+
+    The metric columns stay numeric - currency/percent formatting happens
+    at render time through st.column_config.NumberColumn, which keeps
+    sorting numeric and skips per-cell Python string formatting entirely;
+    unavailable values become NA instead of an 'N/A' string. The frame is
+    stored with arrow-backed dtypes since st.dataframe converts to Arrow
+    for the browser anyway. (pyarrow is always present; it is a hard
+    dependency of Streamlit itself.)
+    """
+    records = pd.DataFrame.from_records(_results, columns=[
+        'symbol', 'name', 'overall_score', 'valuation_score', 'financial_score',
+        'profitability_score', 'growth_score', 'management_score',
+        'ethics_score', 'price', 'pe_ratio', 'dividend_yield', 'market_cap'])
+    names = records['name'].astype(str)
+    df = pd.DataFrame({
+        'Symbol': records['symbol'],
+        'Company': names.where(names.str.len() <= 30, names.str.slice(0, 30) + '...'),
+        'Overall': records['overall_score'],
+        'Valuation': records['valuation_score'],
+        'Financial': records['financial_score'],
+        'Profit': records['profitability_score'],
+        'Growth': records['growth_score'],
+        'Mgmt': records['management_score'],
+        'Ethics': records['ethics_score'],
+        'Price': records['price'],
+        'P/E': records['pe_ratio'].where(records['pe_ratio'] > 0),
+        'Div Yield': records['dividend_yield'].where(records['dividend_yield'] > 0),
+        'Market Cap': (records['market_cap'] / 1e9).where(records['market_cap'] > 0),
+    })
+    return df.convert_dtypes(dtype_backend='pyarrow')
+
+
+@st.cache_data(show_spinner=False)
+def _results_csv(_df: pd.DataFrame, results_token: int) -> bytes:
+    """Serialize the display table to CSV bytes once per screening run.
+
+    to_csv would otherwise run on every rerun whether or not the user
+    clicks download; keyed on the same token as _build_display_df.
+    """
+    return _df.to_csv(index=False).encode()
+
+
 def display_results(results: List[Dict]):
     """Display screening results in a nice table"""
     
     st.header(f"📊 Screening Results ({len(results)} stocks)")
     
-    # Summary metrics
+    # Summary metrics: extract the three columns once, then reduce with
+    # masked NumPy operations instead of one filtered list per metric.
+    summary = np.array(
+        [(r['overall_score'], r['pe_ratio'], r['dividend_yield']) for r in results],
+        dtype=np.float64)
+    scores, pe, div_yield = summary[:, 0], summary[:, 1], summary[:, 2]
+
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        avg_score = np.mean([r['overall_score'] for r in results])
-        st.metric("Average Quality Score", f"{avg_score:.1f}")
+        st.metric("Average Quality Score", f"{scores.mean():.1f}")
     with col2:
-        excellent = len([r for r in results if r['overall_score'] >= 80])
+        excellent = int((scores >= 80).sum())
         st.metric("Excellent Stocks (80+)", excellent)
     with col3:
-        avg_pe = np.mean([r['pe_ratio'] for r in results if r['pe_ratio'] > 0])
+        avg_pe = pe[pe > 0].mean()
         st.metric("Average P/E", f"{avg_pe:.1f}")
     with col4:
-        avg_div = np.mean([r['dividend_yield'] for r in results if r['dividend_yield'] > 0])
+        avg_div = div_yield[div_yield > 0].mean()
         st.metric("Average Div Yield", f"{avg_div:.2f}%")
     
     st.divider()
     
-    # Create DataFrame for display
-    df_display = pd.DataFrame([
-        {
-            'Symbol': r['symbol'],
-            'Company': r['name'][:30] + '...' if len(r['name']) > 30 else r['name'],
-            'Overall': r['overall_score'],
-            'Valuation': r['valuation_score'],
-            'Financial': r['financial_score'],
-            'Profit': r['profitability_score'],
-            'Growth': r['growth_score'],
-            'Mgmt': r['management_score'],
-            'Ethics': r['ethics_score'],
-            'Price': f"${r['price']:.2f}",
-            'P/E': f"{r['pe_ratio']:.1f}" if r['pe_ratio'] > 0 else 'N/A',
-            'Div Yield': f"{r['dividend_yield']:.2f}%" if r['dividend_yield'] > 0 else 'N/A',
-            'Market Cap': f"${r['market_cap']/1e9:.1f}B" if r['market_cap'] > 0 else 'N/A'
-        }
-        for r in results
-    ])
-    
+    # Formatted table is cached per screening run; the token changes only
+    # when the underlying results do.
+    results_token = hash(tuple((r['symbol'], r['overall_score']) for r in results))
+    df_display = _build_display_df(results, results_token)
+
     # Display with formatting
     st.dataframe(
         df_display,
@@ -1048,6 +1621,10 @@ def display_results(results: List[Dict]):
             'Growth': st.column_config.ProgressColumn('Grow', min_value=0, max_value=100),
             'Mgmt': st.column_config.ProgressColumn('Mgmt', min_value=0, max_value=100),
             'Ethics': st.column_config.ProgressColumn('Eth', min_value=0, max_value=100),
+            'Price': st.column_config.NumberColumn('Price', format='$%.2f'),
+            'P/E': st.column_config.NumberColumn('P/E', format='%.1f'),
+            'Div Yield': st.column_config.NumberColumn('Div Yield', format='%.2f%%'),
+            'Market Cap': st.column_config.NumberColumn('Market Cap ($B)', format='$%.1fB'),
         },
         hide_index=True,
         use_container_width=True,
@@ -1059,7 +1636,7 @@ def display_results(results: List[Dict]):
     # Export options
     col1, col2 = st.columns(2)
     with col1:
-        csv = df_display.to_csv(index=False)
+        csv = _results_csv(df_display, results_token)
         st.download_button(
             "📥 Download CSV",
             csv,
@@ -1072,7 +1649,7 @@ def display_results(results: List[Dict]):
         # Add to comparison
         selected_symbols = st.multiselect(
             "Select stocks to compare:",
-            [r['symbol'] for r in results],
+            df_display['Symbol'].tolist(),
             key='select_compare'
         )
         if st.button("Add to Comparison"):
@@ -1080,6 +1657,109 @@ def display_results(results: List[Dict]):
             st.success(f"Added {len(selected_symbols)} stocks to comparison!")
 
 
+# Figure builders are cached on their (hashable) inputs: Streamlit reruns
+# the whole script per widget interaction, and an unchanged figure would
+# otherwise be rebuilt and re-serialized to JSON for the browser each time.
+
+@st.cache_data(show_spinner=False)
+def _radar_fig(score_rows: Tuple) -> go.Figure:
+    """Category-score radar chart; ``score_rows`` holds one
+    (symbol, valuation, financial, profitability, growth, management,
+    ethics) tuple per stock."""
+    fig = go.Figure()
+    categories = ['Valuation', 'Financial', 'Profitability', 'Growth', 'Management', 'Ethics']
+    for symbol, *scores in score_rows:
+        fig.add_trace(go.Scatterpolar(
+            r=list(scores),
+            theta=categories,
+            fill='toself',
+            name=symbol
+        ))
+    fig.update_layout(
+        polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
+        showlegend=True,
+        height=500
+    )
+    return fig
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _relative_perf_fig(_fetcher: StockDataFetcher, symbols: Tuple[str, ...],
+                       period: str) -> Optional[go.Figure]:
+    """Indexed-price comparison chart, or None when no history came back."""
+    hist_map = _fetcher.get_historical_data_batch(list(symbols), period)
+    if not hist_map:
+        return None
+
+    fig = go.Figure()
+    for symbol, hist in hist_map.items():
+        closes = hist['Close'].dropna()
+        if closes.empty:
+            continue
+        fig.add_trace(go.Scatter(
+            x=closes.index,
+            y=closes / closes.iloc[0] * 100,
+            mode='lines',
+            name=symbol
+        ))
+
+    fig.update_layout(
+        xaxis_title="Date",
+        yaxis_title="Indexed Price (start = 100)",
+        hovermode='x unified',
+        height=400
+    )
+    return fig
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _price_history_fig(_fetcher: StockDataFetcher, symbol: str,
+                       period: str) -> Optional[go.Figure]:
+    """Closing-price line chart, or None when no history came back."""
+    hist_data = _fetcher.get_historical_data(symbol, period)
+    if hist_data.empty:
+        return None
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=hist_data.index,
+        y=hist_data['Close'],
+        mode='lines',
+        name='Price',
+        line=dict(color='#1e3c72', width=2)
+    ))
+    fig.update_layout(
+        xaxis_title="Date",
+        yaxis_title="Price ($)",
+        hovermode='x unified',
+        height=400
+    )
+    return fig
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _volume_fig(_fetcher: StockDataFetcher, symbol: str,
+                period: str) -> Optional[go.Figure]:
+    """Volume bar chart, or None when no history came back."""
+    hist_data = _fetcher.get_historical_data(symbol, period)
+    if hist_data.empty:
+        return None
+
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=hist_data.index,
+        y=hist_data['Volume'],
+        name='Volume',
+        marker_color='#2a5298'
+    ))
+    fig.update_layout(
+        xaxis_title="Date",
+        yaxis_title="Volume",
+        height=300
+    )
+    return fig
+
+
 def display_comparison(symbols: List[str]):
     """Display side-by-side comparison of selected stocks"""
     
@@ -1087,7 +1767,8 @@ def display_comparison(symbols: List[str]):
         st.warning("No results available for comparison")
         return
     
-    stocks = [r for r in st.session_state.results if r['symbol'] in symbols]
+    results_by_symbol = st.session_state.results_by_symbol
+    stocks = [results_by_symbol[s] for s in symbols if s in results_by_symbol]
     
     if len(stocks) == 0:
         st.warning("Selected stocks not found in results")
@@ -1095,77 +1776,66 @@ def display_comparison(symbols: List[str]):
     
     st.header(f"🔄 Stock Comparison ({len(stocks)} stocks)")
     
-    # Create comparison table
-    comparison_data = {
-        'Metric': [
-            'Overall Score',
-            'Current Price',
-            'P/E Ratio',
-            'Dividend Yield',
-            'ROE',
-            'ROIC',
-            'Debt/Equity',
-            'Earnings Growth',
-            'Revenue Growth',
-            'Market Cap'
-        ]
-    }
-    
-    for stock in stocks:
-        comparison_data[stock['symbol']] = [
-            f"{stock['overall_score']:.1f}",
-            f"${stock['price']:.2f}",
-            f"{stock['pe_ratio']:.1f}" if stock['pe_ratio'] > 0 else 'N/A',
-            f"{stock['dividend_yield']:.2f}%" if stock['dividend_yield'] > 0 else 'N/A',
-            f"{stock['roe']:.1f}%",
-            f"{stock['roic']:.1f}%",
-            f"{stock['debt_to_equity']:.2f}",
-            f"{stock['earnings_growth']:.1f}%",
-            f"{stock['revenue_growth']:.1f}%",
-            f"${stock['market_cap']/1e9:.1f}B"
-        ]
-    
-    df_comparison = pd.DataFrame(comparison_data)
+    # Build the comparison table columnwise: one formatting pass per metric
+    # over all stocks, then transpose so metrics become rows.
+    cdf = pd.DataFrame(stocks).set_index('symbol')
+
+    def fmt(series, pattern, na_if_nonpositive=False):
+        formatted = series.map(pattern.format)
+        if na_if_nonpositive:
+            formatted = formatted.where(series > 0, 'N/A')
+        return formatted
+
+    df_comparison = pd.DataFrame({
+        'Overall Score': fmt(cdf['overall_score'], '{:.1f}'),
+        'Current Price': fmt(cdf['price'], '${:.2f}'),
+        'P/E Ratio': fmt(cdf['pe_ratio'], '{:.1f}', na_if_nonpositive=True),
+        'Dividend Yield': fmt(cdf['dividend_yield'], '{:.2f}%', na_if_nonpositive=True),
+        'ROE': fmt(cdf['roe'], '{:.1f}%'),
+        'ROIC': fmt(cdf['roic'], '{:.1f}%'),
+        'Debt/Equity': fmt(cdf['debt_to_equity'], '{:.2f}'),
+        'Earnings Growth': fmt(cdf['earnings_growth'], '{:.1f}%'),
+        'Revenue Growth': fmt(cdf['revenue_growth'], '{:.1f}%'),
+        'Market Cap': fmt(cdf['market_cap'] / 1e9, '${:.1f}B'),
+    }).T.rename_axis('Metric').reset_index()
     st.dataframe(df_comparison, use_container_width=True, hide_index=True)
     
     st.divider()
     
     # Radar chart comparison
     st.subheader("📊 Score Comparison")
-    
-    fig = go.Figure()
-    
-    categories = ['Valuation', 'Financial', 'Profitability', 'Growth', 'Management', 'Ethics']
-    
-    for stock in stocks:
-        fig.add_trace(go.Scatterpolar(
-            r=[
-                stock['valuation_score'],
-                stock['financial_score'],
-                stock['profitability_score'],
-                stock['growth_score'],
-                stock['management_score'],
-                stock['ethics_score']
-            ],
-            theta=categories,
-            fill='toself',
-            name=stock['symbol']
-        ))
-    
-    fig.update_layout(
-        polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
-        showlegend=True,
-        height=500
-    )
-    
+
+    fig = _radar_fig(tuple(
+        (s['symbol'], s['valuation_score'], s['financial_score'],
+         s['profitability_score'], s['growth_score'], s['management_score'],
+         s['ethics_score'])
+        for s in stocks))
     st.plotly_chart(fig, use_container_width=True)
-    
+
+    st.divider()
+
+    # Relative performance, fetched for all compared stocks in one download
+    st.subheader("📈 Relative Performance (1 Year)")
+    fig = _relative_perf_fig(
+        st.session_state.fetcher, tuple(s['symbol'] for s in stocks), "1y")
+    if fig is not None:
+        st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.warning("Historical data not available")
+
     # Clear comparison button
     if st.button("🗑️ Clear Comparison"):
         st.session_state.comparison_list = []
         st.rerun()
 
 
+# Score bands shared by the detail view's CSS class and letter grade;
+# indexed via the same _band_index kernel the scorers use.
+_SCORE_BAND_BINS = np.array([70, 80, 90], dtype=np.float32)
+_SCORE_CLASSES = ('score-poor', 'score-fair', 'score-good', 'score-excellent')
+_SCORE_GRADES = ('D', 'C', 'B', 'A')
+
+
 def display_stock_details(results: List[Dict], fetcher: StockDataFetcher):
     """Display detailed analysis for a selected stock"""
     
@@ -1175,22 +1845,23 @@ def display_stock_details(results: List[Dict], fetcher: StockDataFetcher):
     stock_symbols = [r['symbol'] for r in results]
     selected_symbol = st.selectbox("Select a stock:", stock_symbols)
     
-    stock = next((r for r in results if r['symbol'] == selected_symbol), None)
+    stock = st.session_state.results_by_symbol.get(selected_symbol)
     
     if stock is None:
         st.error("Stock not found")
         return
-    
+
+    # Detail labels are built on demand for just this stock - the batch
+    # scoring pass doesn't allocate them.
+    score_details = StockScorer.score_details(
+        stock, st.session_state.get('ethical_profile', 'moderate'))
+
     # Header with key info
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        score_class = (
-            "score-excellent" if stock['overall_score'] >= 90 else
-            "score-good" if stock['overall_score'] >= 80 else
-            "score-fair" if stock['overall_score'] >= 70 else
-            "score-poor"
-        )
+        score_class = _SCORE_CLASSES[
+            _band_index(stock['overall_score'], _SCORE_BAND_BINS, True)]
         st.markdown(f"""
         <div class="{score_class}">
             <h2>{stock['overall_score']:.1f}</h2>
@@ -1233,7 +1904,7 @@ def display_stock_details(results: List[Dict], fetcher: StockDataFetcher):
     
     for label, score, col in scores:
         with col:
-            grade = 'A' if score >= 90 else 'B' if score >= 80 else 'C' if score >= 70 else 'D'
+            grade = _SCORE_GRADES[_band_index(score, _SCORE_BAND_BINS, True)]
             st.metric(label, f"{score:.0f}", f"Grade: {grade}")
     
     st.divider()
@@ -1262,7 +1933,7 @@ def display_stock_details(results: List[Dict], fetcher: StockDataFetcher):
         
         with col2:
             st.subheader("Valuation Analysis")
-            details = stock['score_details']['valuation']
+            details = score_details['valuation']
             for key, value in details.items():
                 st.info(f"**{key.upper()}**: {value}")
             
@@ -1297,7 +1968,7 @@ def display_stock_details(results: List[Dict], fetcher: StockDataFetcher):
         
         with col2:
             st.subheader("Financial Analysis")
-            details = stock['score_details']['financial']
+            details = score_details['financial']
             for key, value in details.items():
                 st.info(f"**{key.replace('_', ' ').title()}**: {value}")
     
@@ -1321,7 +1992,7 @@ def display_stock_details(results: List[Dict], fetcher: StockDataFetcher):
         
         with col2:
             st.subheader("Profitability Analysis")
-            details = stock['score_details']['profitability']
+            details = score_details['profitability']
             for key, value in details.items():
                 st.info(f"**{key.upper()}**: {value}")
     
@@ -1342,53 +2013,24 @@ def display_stock_details(results: List[Dict], fetcher: StockDataFetcher):
         
         with col2:
             st.subheader("Growth Analysis")
-            details = stock['score_details']['growth']
+            details = score_details['growth']
             for key, value in details.items():
                 st.info(f"**{key.replace('_', ' ').title()}**: {value}")
     
     with tab5:
         # Price history chart
         st.subheader("📈 Price History (1 Year)")
-        hist_data = fetcher.get_historical_data(selected_symbol, "1y")
-        
-        if not hist_data.empty:
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(
-                x=hist_data.index,
-                y=hist_data['Close'],
-                mode='lines',
-                name='Price',
-                line=dict(color='#1e3c72', width=2)
-            ))
-            
-            fig.update_layout(
-                xaxis_title="Date",
-                yaxis_title="Price ($)",
-                hovermode='x unified',
-                height=400
-            )
-            
+        fig = _price_history_fig(fetcher, selected_symbol, "1y")
+
+        if fig is not None:
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.warning("Historical data not available")
-        
+
         # Volume chart
-        if not hist_data.empty:
+        fig = _volume_fig(fetcher, selected_symbol, "1y")
+        if fig is not None:
             st.subheader("📊 Volume History")
-            fig = go.Figure()
-            fig.add_trace(go.Bar(
-                x=hist_data.index,
-                y=hist_data['Volume'],
-                name='Volume',
-                marker_color='#2a5298'
-            ))
-            
-            fig.update_layout(
-                xaxis_title="Date",
-                yaxis_title="Volume",
-                height=300
-            )
-            
             st.plotly_chart(fig, use_container_width=True)
     
     st.divider()